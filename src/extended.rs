@@ -72,6 +72,24 @@ impl From<F80> for f64 {
         }
     }
 }
+impl From<F80> for f32 {
+    /// Converts an F80 into an f32, rounding to nearest with ties to even.
+    fn from(float: F80) -> f32 {
+        if float.value.is_zero() {
+            return 0.0;
+        }
+        let sign = float.value.sign().unwrap();
+        let exponent = float.value.exponent().unwrap();
+        let mantissa = float.value.mantissa_digits().unwrap()[0];
+        // rounding to odd on 53 bits first makes the final rounding to 24 bits exact
+        let odd = (mantissa >> 11) | (mantissa & 0x7ff != 0) as u64;
+        let magnitude = odd as f64 * 2f64.powi(exponent as i32 - 53);
+        match sign {
+            Sign::Pos => magnitude as f32,
+            Sign::Neg => -magnitude as f32,
+        }
+    }
+}
 impl From<F80> for u64 {
     /// Converts an F80 into a u64.
     fn from(float: F80) -> u64 {
@@ -200,6 +218,29 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_f32_conversion() {
+        let cases: [f32; 9] = [0.0, 0.5, -0.5, 1.0, -1.5, 1e38, -1e38, 1e-38, -1e-38];
+        for expected in cases.iter() {
+            let result: f32 = F80::from(*expected as f64).into();
+            assert_eq!(result, *expected);
+        }
+        let tie = 1.0 + f32::EPSILON as f64 / 2.0;
+        let cases: [(f64, f32); 4] = [
+            (tie, 1.0),
+            (tie + f64::EPSILON, 1.0 + f32::EPSILON),
+            (
+                1.0 + 3.0 * f32::EPSILON as f64 / 2.0,
+                1.0 + 2.0 * f32::EPSILON,
+            ),
+            (-tie, -1.0),
+        ];
+        for (input, expected) in cases.iter() {
+            let result: f32 = F80::from(*input).into();
+            assert_eq!(result, *expected);
+        }
+    }
+
     #[test]
     fn test_rounding() {
         let cases: [(f64, u64); 13] = [
@@ -5,8 +5,8 @@ pub mod schemes;
 
 use crate::divop::Method;
 use crate::piecewise::{Interp, InterpError};
-use numpy::ndarray::Array1;
-use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1};
+use crate::schemes::{Forward, Inverse};
+use numpy::{Element, IntoPyArray, PyArray1, PyReadonlyArray1};
 use pyo3::exceptions::{PyIndexError, PyKeyError, PyValueError};
 use pyo3::prelude::*;
 
@@ -18,25 +18,9 @@ fn rust<'py>(_py: Python<'py>, m: &'py PyModule) -> PyResult<()> {
         x: PyReadonlyArray1<'py, u64>,
         xp: PyReadonlyArray1<'py, u64>,
         fp: PyReadonlyArray1<'py, i64>,
+        out: Option<&'py PyArray1<i64>>,
     ) -> PyResult<&'py PyArray1<i64>> {
-        let x = x.as_array();
-        let xp = xp.as_array();
-        let fp = fp.as_array();
-        let interp = Interp::new(xp.to_vec(), fp.to_vec());
-        let mut f = Array1::zeros(x.len());
-        for (index, value) in x.iter().zip(f.iter_mut()) {
-            match interp.forward(*index) {
-                Ok(result) => *value = result,
-                Err(InterpError::NotStrictlyIncreasing) => {
-                    return Err(PyValueError::new_err("xp must be strictly increasing"))
-                }
-                Err(InterpError::OutOfBounds) => {
-                    return Err(PyIndexError::new_err("x out of bounds"))
-                }
-                Err(InterpError::NotFound) => return Err(PyIndexError::new_err("x not found")),
-            }
-        }
-        Ok(f.into_pyarray(py))
+        forward(py, x.as_slice()?, xp.as_slice()?, fp.as_slice()?, out)
     }
     #[pyfn(m)]
     fn forward_float<'py>(
@@ -44,25 +28,19 @@ fn rust<'py>(_py: Python<'py>, m: &'py PyModule) -> PyResult<()> {
         x: PyReadonlyArray1<'py, u64>,
         xp: PyReadonlyArray1<'py, u64>,
         fp: PyReadonlyArray1<'py, f64>,
+        out: Option<&'py PyArray1<f64>>,
     ) -> PyResult<&'py PyArray1<f64>> {
-        let x = x.as_array();
-        let xp = xp.as_array().to_vec();
-        let fp = fp.as_array().to_vec();
-        let interp = Interp::new(xp, fp);
-        let mut f = Array1::zeros(x.len());
-        for (index, value) in x.iter().zip(f.iter_mut()) {
-            match interp.forward(*index) {
-                Ok(result) => *value = result,
-                Err(InterpError::NotStrictlyIncreasing) => {
-                    return Err(PyValueError::new_err("xp must be strictly increasing"))
-                }
-                Err(InterpError::OutOfBounds) => {
-                    return Err(PyIndexError::new_err("x out of bounds"))
-                }
-                Err(InterpError::NotFound) => return Err(PyIndexError::new_err("x not found")),
-            }
-        }
-        Ok(f.into_pyarray(py))
+        forward(py, x.as_slice()?, xp.as_slice()?, fp.as_slice()?, out)
+    }
+    #[pyfn(m)]
+    fn forward_float32<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArray1<'py, u64>,
+        xp: PyReadonlyArray1<'py, u64>,
+        fp: PyReadonlyArray1<'py, f32>,
+        out: Option<&'py PyArray1<f32>>,
+    ) -> PyResult<&'py PyArray1<f32>> {
+        forward(py, x.as_slice()?, xp.as_slice()?, fp.as_slice()?, out)
     }
     #[pyfn(m)]
     fn inverse_int<'py>(
@@ -71,36 +49,17 @@ fn rust<'py>(_py: Python<'py>, m: &'py PyModule) -> PyResult<()> {
         xp: PyReadonlyArray1<'py, u64>,
         fp: PyReadonlyArray1<'py, i64>,
         method: Option<&str>,
+        out: Option<&'py PyArray1<u64>>,
     ) -> PyResult<&'py PyArray1<u64>> {
-        let f = f.as_array();
-        let xp = xp.as_array();
-        let fp = fp.as_array();
-        let method = match method {
-            None => Method::None,
-            Some("nearest") => Method::Nearest,
-            Some("ffill") => Method::ForwardFill,
-            Some("bfill") => Method::BackwardFill,
-            Some(_) => {
-                return Err(PyValueError::new_err(
-                    "method must be either None, 'nearest', 'ffill' or 'bfill'",
-                ))
-            }
-        };
-        let interp = Interp::new(xp.to_vec(), fp.to_vec());
-        let mut x = Array1::zeros(f.len());
-        for (value, index) in f.iter().zip(x.iter_mut()) {
-            match interp.inverse(*value, method) {
-                Ok(result) => *index = result,
-                Err(InterpError::NotStrictlyIncreasing) => {
-                    return Err(PyValueError::new_err("fp must be strictly increasing"))
-                }
-                Err(InterpError::OutOfBounds) => {
-                    return Err(PyKeyError::new_err("f out of bounds"))
-                }
-                Err(InterpError::NotFound) => return Err(PyKeyError::new_err("f not found")),
-            }
-        }
-        Ok(x.into_pyarray(py))
+        let method = parse_method(method)?;
+        inverse(
+            py,
+            f.as_slice()?,
+            xp.as_slice()?,
+            fp.as_slice()?,
+            method,
+            out,
+        )
     }
     #[pyfn(m)]
     fn inverse_float<'py>(
@@ -109,36 +68,142 @@ fn rust<'py>(_py: Python<'py>, m: &'py PyModule) -> PyResult<()> {
         xp: PyReadonlyArray1<'py, u64>,
         fp: PyReadonlyArray1<'py, f64>,
         method: Option<&str>,
+        out: Option<&'py PyArray1<u64>>,
+    ) -> PyResult<&'py PyArray1<u64>> {
+        let method = parse_method(method)?;
+        inverse(
+            py,
+            f.as_slice()?,
+            xp.as_slice()?,
+            fp.as_slice()?,
+            method,
+            out,
+        )
+    }
+    #[pyfn(m)]
+    fn inverse_float32<'py>(
+        py: Python<'py>,
+        f: PyReadonlyArray1<'py, f32>,
+        xp: PyReadonlyArray1<'py, u64>,
+        fp: PyReadonlyArray1<'py, f32>,
+        method: Option<&str>,
+        out: Option<&'py PyArray1<u64>>,
     ) -> PyResult<&'py PyArray1<u64>> {
-        let f = f.as_array();
-        let xp = xp.as_array().to_vec();
-        let fp = fp.as_array().to_vec();
-        let method = match method {
-            None => Method::None,
-            Some("nearest") => Method::Nearest,
-            Some("ffill") => Method::ForwardFill,
-            Some("bfill") => Method::BackwardFill,
-            Some(_) => {
-                return Err(PyValueError::new_err(
-                    "method must be either None, 'nearest', 'ffill' or 'bfill'",
-                ))
+        let method = parse_method(method)?;
+        inverse(
+            py,
+            f.as_slice()?,
+            xp.as_slice()?,
+            fp.as_slice()?,
+            method,
+            out,
+        )
+    }
+    Ok(())
+}
+
+/// Performs forward interpolation with the GIL released, writing the values into `out` if
+/// given or into a new array otherwise.
+fn forward<'py, F>(
+    py: Python<'py>,
+    x: &[u64],
+    xp: &[u64],
+    fp: &[F],
+    out: Option<&'py PyArray1<F>>,
+) -> PyResult<&'py PyArray1<F>>
+where
+    u64: Forward<F>,
+    F: Inverse<u64> + Element + Default + Send + Sync,
+{
+    match out {
+        Some(out) => {
+            let mut buffer = out.try_readwrite()?;
+            let f = buffer.as_slice_mut()?;
+            if f.len() != x.len() {
+                return Err(PyValueError::new_err("out and x must have the same length"));
             }
-        };
-        let interp = Interp::new(xp, fp);
-        let mut x = Array1::zeros(f.len());
-        for (value, index) in f.iter().zip(x.iter_mut()) {
-            match interp.inverse(*value, method) {
-                Ok(result) => *index = result,
-                Err(InterpError::NotStrictlyIncreasing) => {
-                    return Err(PyValueError::new_err("fp must be strictly increasing"))
-                }
-                Err(InterpError::OutOfBounds) => {
-                    return Err(PyKeyError::new_err("f out of bounds"))
-                }
-                Err(InterpError::NotFound) => return Err(PyKeyError::new_err("f not found")),
+            py.allow_threads(|| Interp::new(xp, fp).forward_into(x, f))
+                .map_err(forward_error)?;
+            Ok(out)
+        }
+        None => {
+            let f = py
+                .allow_threads(|| Interp::new(xp, fp).forward_slice(x))
+                .map_err(forward_error)?;
+            Ok(f.into_pyarray(py))
+        }
+    }
+}
+
+/// Performs inverse interpolation with the GIL released, writing the indices into `out` if
+/// given or into a new array otherwise.
+fn inverse<'py, F>(
+    py: Python<'py>,
+    f: &[F],
+    xp: &[u64],
+    fp: &[F],
+    method: Method,
+    out: Option<&'py PyArray1<u64>>,
+) -> PyResult<&'py PyArray1<u64>>
+where
+    u64: Forward<F>,
+    F: Inverse<u64> + Sync,
+{
+    match out {
+        Some(out) => {
+            let mut buffer = out.try_readwrite()?;
+            let x = buffer.as_slice_mut()?;
+            if x.len() != f.len() {
+                return Err(PyValueError::new_err("out and f must have the same length"));
             }
+            py.allow_threads(|| Interp::new(xp, fp).inverse_into(f, method, x))
+                .map_err(inverse_error)?;
+            Ok(out)
+        }
+        None => {
+            let x = py
+                .allow_threads(|| Interp::new(xp, fp).inverse_slice(f, method))
+                .map_err(inverse_error)?;
+            Ok(x.into_pyarray(py))
         }
-        Ok(x.into_pyarray(py))
     }
-    Ok(())
+}
+
+/// Parses the rounding method passed from Python.
+fn parse_method(method: Option<&str>) -> PyResult<Method> {
+    match method {
+        None => Ok(Method::None),
+        Some("nearest") => Ok(Method::Nearest),
+        Some("ffill") => Ok(Method::ForwardFill),
+        Some("bfill") => Ok(Method::BackwardFill),
+        Some(_) => Err(PyValueError::new_err(
+            "method must be either None, 'nearest', 'ffill' or 'bfill'",
+        )),
+    }
+}
+
+/// Converts a forward interpolation error into the matching Python exception.
+fn forward_error(err: InterpError) -> PyErr {
+    match err {
+        InterpError::NotStrictlyIncreasing => {
+            PyValueError::new_err("xp must be strictly increasing")
+        }
+        InterpError::OutOfBounds => PyIndexError::new_err("x out of bounds"),
+        InterpError::NotFound => PyIndexError::new_err("x not found"),
+        InterpError::NotFinite => unreachable!("forward queries are integers, always finite"),
+        InterpError::NotFiniteValues => PyValueError::new_err("fp values must be finite"),
+    }
+}
+
+/// Converts an inverse interpolation error into the matching Python exception.
+fn inverse_error(err: InterpError) -> PyErr {
+    match err {
+        InterpError::NotStrictlyIncreasing => {
+            PyValueError::new_err("fp must be strictly increasing")
+        }
+        InterpError::OutOfBounds => PyKeyError::new_err("f out of bounds"),
+        InterpError::NotFound => PyKeyError::new_err("f not found"),
+        InterpError::NotFinite => PyValueError::new_err("f values must be finite"),
+        InterpError::NotFiniteValues => PyValueError::new_err("fp values must be finite"),
+    }
 }
@@ -14,7 +14,7 @@
 //! let xp = vec![0, 2, 4];
 //! let fp = vec![0.0, 4.0, 16.0];
 //!
-//! let interp = Interp::new(xp, fp);
+//! let interp = Interp::new(&xp, &fp);
 //!
 //! let result = interp.forward(3);
 //! assert_eq!(result, Ok(10.0));
@@ -31,9 +31,16 @@
 //! known data points.
 //! - `InterpError::NotStrictlyIncreasing`: Indicates that the input or output values are not
 //! strictly increasing, which is required for interpolation.
+//! - `InterpError::NotFinite`: Indicates that the input value is nan or infinite.
+//! - `InterpError::NotFiniteValues`: Indicates that some of the data values are nan or infinite.
 
 use crate::divop::Method;
 use crate::schemes::{Forward, Inverse};
+use rayon::prelude::*;
+use std::cmp::Ordering;
+
+/// Number of queries per parallel task. Fewer queries are processed on the calling thread.
+const CHUNK_SIZE: usize = 4096;
 
 // Interpolation Errors
 #[derive(PartialEq, Debug)]
@@ -41,42 +48,67 @@ pub enum InterpError {
     OutOfBounds,
     NotFound,
     NotStrictlyIncreasing,
+    NotFinite,
+    NotFiniteValues,
 }
 
 /// Structure for performing forward and inverse interpolation on piecewise linear functions.
-pub struct Interp<X, F> {
-    xp: Vec<X>,
-    fp: Vec<F>,
+pub struct Interp<'a, X, F> {
+    xp: &'a [X],
+    fp: &'a [F],
+    finite: bool,
     forwardable: bool,
     inversable: bool,
 }
 
-impl<X, F> Interp<X, F>
+impl<'a, X, F> Interp<'a, X, F>
 where
     X: Forward<F>,
     F: Inverse<X>,
 {
-    /// Constructs a new Interp instance with the given data points.
+    /// Constructs a new Interp instance borrowing the given data points.
     ///
     /// # Arguments
     ///
-    /// * `xp` - Vector of indices.
-    /// * `fp` - Vector of corresponding values.
+    /// * `xp` - Slice of indices.
+    /// * `fp` - Slice of corresponding values.
     ///
     /// # Panics
     ///
     /// Panics if the lengths of `xp` and `fp` are not equal.
-    pub fn new(xp: Vec<X>, fp: Vec<F>) -> Interp<X, F> {
+    pub fn new(xp: &'a [X], fp: &'a [F]) -> Interp<'a, X, F> {
         assert!(xp.len() == fp.len(), "xp and fp must have same length");
+        let finite = fp.iter().all(|&value| value.is_finite());
         let forwardable = xp.windows(2).all(|pair| pair[0] < pair[1]);
         let inversable = fp.windows(2).all(|pair| pair[0] < pair[1]);
         Interp {
             xp,
             fp,
+            finite,
             forwardable,
             inversable,
         }
     }
+    /// Checks that the data points allow forward interpolation.
+    fn check_forward(&self) -> Result<(), InterpError> {
+        if !self.finite {
+            Err(InterpError::NotFiniteValues)
+        } else if !self.forwardable {
+            Err(InterpError::NotStrictlyIncreasing)
+        } else {
+            Ok(())
+        }
+    }
+    /// Checks that the data points allow inverse interpolation.
+    fn check_inverse(&self) -> Result<(), InterpError> {
+        if !self.finite {
+            Err(InterpError::NotFiniteValues)
+        } else if !self.inversable {
+            Err(InterpError::NotStrictlyIncreasing)
+        } else {
+            Ok(())
+        }
+    }
     /// Performs forward interpolation at the given index.
     ///
     /// # Arguments
@@ -88,20 +120,91 @@ where
     /// If successful, returns the interpolated value.
     /// Otherwise, returns an error indicating the reason for failure.
     pub fn forward(&self, rhs: X) -> Result<F, InterpError> {
-        if self.forwardable {
-            match self.xp.binary_search(&rhs) {
-                Ok(index) => Ok(self.fp[index]),
-                Err(0) => Err(InterpError::OutOfBounds),
-                Err(len) if len == self.xp.len() => Err(InterpError::OutOfBounds),
-                Err(index) => Ok(rhs.forward(
-                    self.xp[index - 1],
-                    self.xp[index],
-                    self.fp[index - 1],
-                    self.fp[index],
-                )),
+        self.forward_with_guess(rhs, &mut 0)
+    }
+    /// Performs forward interpolation at the given index, starting the search from a guess.
+    ///
+    /// # Arguments
+    ///
+    /// * `rhs` - The index for forward interpolation.
+    /// * `guess` - The position in `xp` where to start the search. It is updated with the
+    /// position of the interval found so that successive close indices are located in a few
+    /// comparisons.
+    ///
+    /// # Returns
+    ///
+    /// If successful, returns the interpolated value.
+    /// Otherwise, returns an error indicating the reason for failure.
+    pub fn forward_with_guess(&self, rhs: X, guess: &mut usize) -> Result<F, InterpError> {
+        self.check_forward()?;
+        match search(&self.xp, &rhs, guess) {
+            Ok(index) => Ok(self.fp[index]),
+            Err(0) => Err(InterpError::OutOfBounds),
+            Err(len) if len == self.xp.len() => Err(InterpError::OutOfBounds),
+            Err(index) => Ok(rhs.forward(
+                self.xp[index - 1],
+                self.xp[index],
+                self.fp[index - 1],
+                self.fp[index],
+            )),
+        }
+    }
+    /// Performs forward interpolation at each of the given indices.
+    ///
+    /// See `forward_into`, the values are returned in a new vector.
+    pub fn forward_slice(&self, x: &[X]) -> Result<Vec<F>, InterpError>
+    where
+        X: Sync,
+        F: Default + Send + Sync,
+    {
+        let mut f = vec![F::default(); x.len()];
+        self.forward_into(x, &mut f)?;
+        Ok(f)
+    }
+    /// Performs forward interpolation at each of the given indices, writing the values in the
+    /// given slice.
+    ///
+    /// The indices are processed in parallel by chunks. Within a chunk, the search of each
+    /// index starts from the interval found for the previous one.
+    ///
+    /// # Arguments
+    ///
+    /// * `x` - The indices for forward interpolation.
+    /// * `f` - The slice where to write the interpolated values.
+    ///
+    /// # Returns
+    ///
+    /// If successful, returns nothing and `f` holds the interpolated values.
+    /// Otherwise, returns the first error encountered, `f` is then partially written. The data
+    /// points are checked before any index so that invalid data points are reported even if `x`
+    /// is empty.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the lengths of `x` and `f` are not equal.
+    pub fn forward_into(&self, x: &[X], f: &mut [F]) -> Result<(), InterpError>
+    where
+        X: Sync,
+        F: Send + Sync,
+    {
+        assert!(x.len() == f.len(), "x and f must have same length");
+        self.check_forward()?;
+        let fill = |(f, x): (&mut [F], &[X])| {
+            let mut guess = 0;
+            for (value, &rhs) in f.iter_mut().zip(x) {
+                *value = self.forward_with_guess(rhs, &mut guess)?;
             }
+            Ok(())
+        };
+        if x.len() <= CHUNK_SIZE {
+            fill((f, x))
         } else {
-            Err(InterpError::NotStrictlyIncreasing)
+            f.par_chunks_mut(CHUNK_SIZE)
+                .zip(x.par_chunks(CHUNK_SIZE))
+                .map(fill)
+                .collect::<Vec<Result<(), InterpError>>>()
+                .into_iter()
+                .collect()
         }
     }
     /// Performs inverse interpolation at the given value.
@@ -116,34 +219,190 @@ where
     /// If successful, returns the interpolated input value.
     /// Otherwise, returns an error indicating the reason for failure.
     pub fn inverse(&self, rhs: F, method: Method) -> Result<X, InterpError> {
-        if self.inversable {
-            match self
-                .fp
-                .binary_search_by(|f| f.partial_cmp(&rhs).expect("nan or inf encountered"))
-            {
-                Ok(index) => Ok(self.xp[index]),
-                Err(0) => match method {
-                    Method::None | Method::ForwardFill => Err(InterpError::OutOfBounds),
-                    Method::Nearest | Method::BackwardFill => Ok(self.xp[0]),
-                },
-                Err(len) if len == self.xp.len() => match method {
-                    Method::None | Method::BackwardFill => Err(InterpError::OutOfBounds),
-                    Method::Nearest | Method::ForwardFill => Ok(self.xp[len - 1]),
-                },
-                Err(index) => rhs
-                    .inverse(
-                        self.xp[index - 1],
-                        self.xp[index],
-                        self.fp[index - 1],
-                        self.fp[index],
-                        method,
-                    )
-                    .ok_or(InterpError::NotFound),
+        self.inverse_with_guess(rhs, method, &mut 0)
+    }
+    /// Performs inverse interpolation at the given value, starting the search from a guess.
+    ///
+    /// # Arguments
+    ///
+    /// * `rhs` - The value for inverse interpolation.
+    /// * `method` - The rounding method to use in case of inexact matching.
+    /// * `guess` - The position in `fp` where to start the search. It is updated with the
+    /// position of the interval found so that successive close values are located in a few
+    /// comparisons.
+    ///
+    /// # Returns
+    ///
+    /// If successful, returns the interpolated input value.
+    /// Otherwise, returns an error indicating the reason for failure.
+    pub fn inverse_with_guess(
+        &self,
+        rhs: F,
+        method: Method,
+        guess: &mut usize,
+    ) -> Result<X, InterpError> {
+        self.check_inverse()?;
+        if !rhs.is_finite() {
+            return Err(InterpError::NotFinite);
+        }
+        match search(&self.fp, &rhs, guess) {
+            Ok(index) => Ok(self.xp[index]),
+            Err(0) => match method {
+                Method::None | Method::ForwardFill => Err(InterpError::OutOfBounds),
+                Method::Nearest | Method::BackwardFill => Ok(self.xp[0]),
+            },
+            Err(len) if len == self.xp.len() => match method {
+                Method::None | Method::BackwardFill => Err(InterpError::OutOfBounds),
+                Method::Nearest | Method::ForwardFill => Ok(self.xp[len - 1]),
+            },
+            Err(index) => rhs
+                .inverse(
+                    self.xp[index - 1],
+                    self.xp[index],
+                    self.fp[index - 1],
+                    self.fp[index],
+                    method,
+                )
+                .ok_or(InterpError::NotFound),
+        }
+    }
+    /// Performs inverse interpolation at each of the given values.
+    ///
+    /// See `inverse_into`, the indices are returned in a new vector.
+    pub fn inverse_slice(&self, f: &[F], method: Method) -> Result<Vec<X>, InterpError>
+    where
+        X: Default + Send + Sync,
+        F: Sync,
+    {
+        let mut x = vec![X::default(); f.len()];
+        self.inverse_into(f, method, &mut x)?;
+        Ok(x)
+    }
+    /// Performs inverse interpolation at each of the given values, writing the indices in the
+    /// given slice.
+    ///
+    /// The values are processed in parallel by chunks. Within a chunk, the search of each
+    /// value starts from the interval found for the previous one.
+    ///
+    /// # Arguments
+    ///
+    /// * `f` - The values for inverse interpolation.
+    /// * `method` - The rounding method to use in case of inexact matching.
+    /// * `x` - The slice where to write the interpolated indices.
+    ///
+    /// # Returns
+    ///
+    /// If successful, returns nothing and `x` holds the interpolated indices.
+    /// Otherwise, returns the first error encountered, `x` is then partially written. The data
+    /// points are checked before any value so that invalid data points are reported even if `f`
+    /// is empty.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the lengths of `f` and `x` are not equal.
+    pub fn inverse_into(&self, f: &[F], method: Method, x: &mut [X]) -> Result<(), InterpError>
+    where
+        X: Send + Sync,
+        F: Sync,
+    {
+        assert!(f.len() == x.len(), "f and x must have same length");
+        self.check_inverse()?;
+        let fill = |(x, f): (&mut [X], &[F])| {
+            let mut guess = 0;
+            for (index, &rhs) in x.iter_mut().zip(f) {
+                *index = self.inverse_with_guess(rhs, method, &mut guess)?;
             }
+            Ok(())
+        };
+        if f.len() <= CHUNK_SIZE {
+            fill((x, f))
         } else {
-            Err(InterpError::NotStrictlyIncreasing)
+            x.par_chunks_mut(CHUNK_SIZE)
+                .zip(f.par_chunks(CHUNK_SIZE))
+                .map(fill)
+                .collect::<Vec<Result<(), InterpError>>>()
+                .into_iter()
+                .collect()
+        }
+    }
+}
+
+/// Binary search with guess on strictly increasing points.
+///
+/// The intervals starting at `guess` and at the two following points are checked first, which
+/// resolves successive sorted or close queries in a few comparisons. Otherwise the search only
+/// looks on the side of `guess` where `rhs` lies: it gallops forward from the guess or bisects
+/// the points before it. Sorted queries thus walk the points once, like a merge, in
+/// O(m log(n/m)) comparisons overall. The result follows the `binary_search` convention: `Ok`
+/// with the position of a matching point or `Err` with the position where `rhs` could be
+/// inserted. The `guess` is updated with the position of the lower point of the interval found.
+///
+/// # Panics
+///
+/// Panics if `rhs` or any of the compared points is nan.
+fn search<T: PartialOrd>(points: &[T], rhs: &T, guess: &mut usize) -> Result<usize, usize> {
+    let order = |point: &T| point.partial_cmp(rhs).expect("nan or inf encountered");
+    let index = *guess;
+    let result = match points.get(index).map(order) {
+        Some(Ordering::Equal) => Ok(index),
+        Some(Ordering::Less) => match points.get(index + 1).map(order) {
+            None | Some(Ordering::Greater) => Err(index + 1),
+            Some(Ordering::Equal) => Ok(index + 1),
+            Some(Ordering::Less) => match points.get(index + 2).map(order) {
+                None | Some(Ordering::Greater) => Err(index + 2),
+                Some(Ordering::Equal) => Ok(index + 2),
+                Some(Ordering::Less) => gallop(points, index + 2, order),
+            },
+        },
+        Some(Ordering::Greater) => bisect(&points[..index], &order),
+        None => bisect(points, &order),
+    };
+    *guess = match result {
+        Ok(index) => index,
+        Err(index) => index.saturating_sub(1),
+    };
+    result
+}
+
+/// Maximum number of points searched by a linear scan rather than by bisection.
+const LINEAR_SEARCH_MAX: usize = 16;
+
+/// Binary search on strictly increasing points, scanning short slices linearly.
+///
+/// The scan counts the points less than `rhs` without early exit: the comparisons do not
+/// depend on each other and compile to branchless, vectorizable code that beats the
+/// unpredictable branches of bisection when the points fit in a couple of cache lines.
+fn bisect<T>(points: &[T], order: impl Fn(&T) -> Ordering) -> Result<usize, usize> {
+    if points.len() <= LINEAR_SEARCH_MAX {
+        let index = points
+            .iter()
+            .filter(|&point| order(point) == Ordering::Less)
+            .count();
+        match points.get(index).map(&order) {
+            Some(Ordering::Equal) => Ok(index),
+            _ => Err(index),
         }
+    } else {
+        points.binary_search_by(order)
+    }
+}
+
+/// Exponential search on strictly increasing points knowing that `points[start] < rhs`.
+///
+/// The step from `start` is doubled until a point not less than `rhs` is met, then the last
+/// step is bisected. The cost is logarithmic in the distance to the result rather than in the
+/// number of points.
+fn gallop<T>(points: &[T], start: usize, order: impl Fn(&T) -> Ordering) -> Result<usize, usize> {
+    let mut low = start;
+    let mut step = 1;
+    while low + step < points.len() && order(&points[low + step]) == Ordering::Less {
+        low += step;
+        step *= 2;
     }
+    let high = (low + step + 1).min(points.len());
+    bisect(&points[low + 1..high], &order)
+        .map(|index| low + 1 + index)
+        .map_err(|index| low + 1 + index)
 }
 
 #[cfg(test)]
@@ -154,22 +413,158 @@ mod tests {
     fn test_initialization() {
         let xp: Vec<u64> = vec![0, 10];
         let fp: Vec<i64> = vec![20, 25];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert!(interp.forwardable);
         assert!(interp.inversable);
 
         let xp: Vec<u64> = vec![0, 10];
         let fp: Vec<i64> = vec![-20, -25];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert!(interp.forwardable);
         assert!(!interp.inversable);
     }
 
+    #[test]
+    fn test_search_with_guess() {
+        let points: Vec<u64> = vec![0, 10, 20, 30, 40];
+        for guess in 0..7 {
+            for rhs in 0..45 {
+                let mut hint = guess;
+                assert_eq!(search(&points, &rhs, &mut hint), points.binary_search(&rhs));
+                match points.binary_search(&rhs) {
+                    Ok(index) => assert_eq!(hint, index),
+                    Err(index) => assert_eq!(hint, index.saturating_sub(1)),
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_search_gallop() {
+        let points: Vec<u64> = (0..100).map(|index| 3 * index).collect();
+        for guess in [0, 1, 17, 50, 98, 99] {
+            for rhs in 0..310 {
+                let mut hint = guess;
+                assert_eq!(search(&points, &rhs, &mut hint), points.binary_search(&rhs));
+            }
+        }
+        let mut hint = 0;
+        for rhs in (0..310).step_by(7) {
+            assert_eq!(search(&points, &rhs, &mut hint), points.binary_search(&rhs));
+        }
+    }
+
+    #[test]
+    fn test_bisect() {
+        for len in [0, 1, 2, LINEAR_SEARCH_MAX, LINEAR_SEARCH_MAX + 1, 100] {
+            let points: Vec<i64> = (0..len as i64).map(|index| 3 * index - 10).collect();
+            for rhs in -15..310 {
+                let order = |point: &i64| point.cmp(&rhs);
+                assert_eq!(bisect(&points, order), points.binary_search(&rhs));
+            }
+        }
+    }
+
+    #[test]
+    fn test_forward_with_guess() {
+        let xp: Vec<u64> = vec![0, 10, 20, 30];
+        let fp: Vec<f64> = vec![20.0, 25.0, 45.0, 50.0];
+        let interp = Interp::new(&xp, &fp);
+        let mut guess = 0;
+        for x in (0..31).chain((0..31).rev()) {
+            assert_eq!(interp.forward_with_guess(x, &mut guess), interp.forward(x));
+        }
+        assert_eq!(
+            interp.forward_with_guess(31, &mut guess),
+            Err(InterpError::OutOfBounds)
+        );
+    }
+
+    #[test]
+    fn test_inverse_with_guess() {
+        let xp: Vec<u64> = vec![0, 10, 20, 30];
+        let fp: Vec<i64> = vec![-20, 25, 45, 50];
+        let interp = Interp::new(&xp, &fp);
+        let mut guess = 0;
+        for f in (-25..55).chain((-25..55).rev()) {
+            assert_eq!(
+                interp.inverse_with_guess(f, Method::Nearest, &mut guess),
+                interp.inverse(f, Method::Nearest)
+            );
+        }
+    }
+
+    #[test]
+    fn test_slice() {
+        let xp: Vec<u64> = vec![0, 10, 20];
+        let fp: Vec<i64> = vec![20, 25, 15];
+        let interp = Interp::new(&xp, &fp);
+        assert_eq!(
+            interp.forward_slice(&[0, 4, 20, 12]),
+            Ok(vec![20, 22, 15, 23])
+        );
+        let mut f = [0; 2];
+        assert_eq!(interp.forward_into(&[4, 12], &mut f), Ok(()));
+        assert_eq!(f, [22, 23]);
+        assert_eq!(
+            interp.forward_slice(&[0, 21]),
+            Err(InterpError::OutOfBounds)
+        );
+        assert_eq!(
+            interp.inverse_slice(&[], Method::None),
+            Err(InterpError::NotStrictlyIncreasing)
+        );
+        let fp: Vec<i64> = vec![20, 25, 45];
+        let interp = Interp::new(&xp, &fp);
+        assert_eq!(
+            interp.inverse_slice(&[20, 29, 45], Method::Nearest),
+            Ok(vec![0, 12, 20])
+        );
+        let mut x = [0; 2];
+        assert_eq!(
+            interp.inverse_into(&[29, 45], Method::Nearest, &mut x),
+            Ok(())
+        );
+        assert_eq!(x, [12, 20]);
+        assert_eq!(
+            interp.inverse_slice(&[20, 26], Method::None),
+            Err(InterpError::NotFound)
+        );
+    }
+
+    #[test]
+    fn test_slice_chunks() {
+        let xp: Vec<u64> = vec![0, 1000, 3000];
+        let fp: Vec<i64> = vec![-7, 5000, 6001];
+        let interp = Interp::new(&xp, &fp);
+        let x: Vec<u64> = (0..3 * CHUNK_SIZE as u64)
+            .map(|index| (index * 7919) % 3001)
+            .collect();
+        let f: Vec<i64> = x.iter().map(|&x| interp.forward(x).unwrap()).collect();
+        assert_eq!(interp.forward_slice(&x), Ok(f.clone()));
+        let expected: Vec<u64> = f
+            .iter()
+            .map(|&f| interp.inverse(f, Method::Nearest).unwrap())
+            .collect();
+        assert_eq!(interp.inverse_slice(&f, Method::Nearest), Ok(expected));
+        let mut x = x;
+        x[2 * CHUNK_SIZE] = 3001;
+        x[CHUNK_SIZE + 1] = 3001;
+        assert_eq!(interp.forward_slice(&x), Err(InterpError::OutOfBounds));
+        let mut f = f;
+        f[2 * CHUNK_SIZE] = 6002;
+        f[CHUNK_SIZE + 1] = 6;
+        assert_eq!(
+            interp.inverse_slice(&f, Method::None),
+            Err(InterpError::NotFound)
+        );
+    }
+
     #[test]
     fn test_forward_unsigned() {
         let xp: Vec<u64> = vec![0, 10];
         let fp: Vec<u64> = vec![20, 25];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.forward(0), Ok(20));
         assert_eq!(interp.forward(1), Ok(20));
         assert_eq!(interp.forward(2), Ok(21));
@@ -181,7 +576,7 @@ mod tests {
     fn test_forward_signed() {
         let xp: Vec<u64> = vec![0, 10];
         let fp: Vec<i64> = vec![-20, -25];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.forward(0), Ok(-20));
         assert_eq!(interp.forward(1), Ok(-20));
         assert_eq!(interp.forward(2), Ok(-21));
@@ -193,7 +588,7 @@ mod tests {
     fn test_forward_float() {
         let xp: Vec<u64> = vec![0, 10];
         let fp: Vec<f64> = vec![20.0, 25.0];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.forward(0), Ok(20.0));
         assert_eq!(interp.forward(1), Ok(20.5));
         assert_eq!(interp.forward(2), Ok(21.0));
@@ -205,7 +600,7 @@ mod tests {
     fn test_inverse_exact_unsigned() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<u64> = vec![20, 30];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(
             interp.inverse(19, Method::None),
             Err(InterpError::OutOfBounds)
@@ -228,7 +623,7 @@ mod tests {
     fn test_inverse_round_unsigned() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<u64> = vec![20, 30];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(19, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(20, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(21, Method::Nearest), Ok(0));
@@ -245,7 +640,7 @@ mod tests {
     fn test_inverse_ffill_unsigned() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<u64> = vec![20, 30];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(
             interp.inverse(19, Method::ForwardFill),
             Err(InterpError::OutOfBounds)
@@ -265,7 +660,7 @@ mod tests {
     fn test_inverse_bfill_unsigned() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<u64> = vec![20, 30];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(19, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(20, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(21, Method::BackwardFill), Ok(1));
@@ -285,7 +680,7 @@ mod tests {
     fn test_inverse_exact_signed() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<i64> = vec![-30, -20];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(
             interp.inverse(-31, Method::None),
             Err(InterpError::OutOfBounds)
@@ -317,7 +712,7 @@ mod tests {
     fn test_inverse_round_signed() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<i64> = vec![-30, -20];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(-31, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(-30, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(-29, Method::Nearest), Ok(0));
@@ -334,7 +729,7 @@ mod tests {
     fn test_inverse_ffill_signed() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<i64> = vec![-30, -20];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(
             interp.inverse(-31, Method::ForwardFill),
             Err(InterpError::OutOfBounds)
@@ -354,7 +749,7 @@ mod tests {
     fn test_inverse_bfill_signed() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<i64> = vec![-30, -20];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(-31, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(-30, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(-29, Method::BackwardFill), Ok(1));
@@ -370,11 +765,56 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_inverse_not_finite() {
+        let xp: Vec<u64> = vec![0, 5];
+        let fp: Vec<f64> = vec![20.0, 30.0];
+        let interp = Interp::new(&xp, &fp);
+        for f in [f64::NAN, f64::INFINITY, f64::NEG_INFINITY] {
+            assert_eq!(
+                interp.inverse(f, Method::Nearest),
+                Err(InterpError::NotFinite)
+            );
+        }
+    }
+
+    #[test]
+    fn test_not_finite_values() {
+        let xp: Vec<u64> = vec![0, 5, 10];
+        for value in [f64::NAN, f64::INFINITY, f64::NEG_INFINITY] {
+            let fp: Vec<f64> = vec![20.0, value, 30.0];
+            let interp = Interp::new(&xp, &fp);
+            assert!(!interp.finite);
+            assert_eq!(interp.forward(0), Err(InterpError::NotFiniteValues));
+            assert_eq!(
+                interp.inverse(20.0, Method::Nearest),
+                Err(InterpError::NotFiniteValues)
+            );
+            assert_eq!(interp.forward_slice(&[]), Err(InterpError::NotFiniteValues));
+        }
+    }
+
+    #[test]
+    fn test_float32() {
+        let xp: Vec<u64> = vec![0, 3];
+        let fp: Vec<f32> = vec![0.0, 1.0];
+        let interp = Interp::new(&xp, &fp);
+        assert_eq!(
+            interp.forward_slice(&[0, 1, 3]),
+            Ok(vec![0.0, 1.0 / 3.0, 1.0])
+        );
+        assert_eq!(interp.inverse(1.0 / 3.0, Method::Nearest), Ok(1));
+        assert_eq!(
+            interp.inverse(f32::NAN, Method::Nearest),
+            Err(InterpError::NotFinite)
+        );
+    }
+
     #[test]
     fn test_inverse_round_float() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<f64> = vec![20.0, 30.0];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(19.9, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(20.0, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(20.1, Method::Nearest), Ok(0));
@@ -395,7 +835,7 @@ mod tests {
     fn test_inverse_ffill_float() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<f64> = vec![20.0, 30.0];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(
             interp.inverse(19.9, Method::ForwardFill),
             Err(InterpError::OutOfBounds)
@@ -419,7 +859,7 @@ mod tests {
     fn test_inverse_bfill_float() {
         let xp: Vec<u64> = vec![0, 5];
         let fp: Vec<f64> = vec![20.0, 30.0];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(19.9, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(20.0, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(20.1, Method::BackwardFill), Ok(1));
@@ -441,7 +881,7 @@ mod tests {
 
     #[test]
     fn test_forward_big_numbers() {
-        let interp = Interp::new(vec![0, u64::MAX], vec![i64::MIN, i64::MAX]);
+        let interp = Interp::new(&[0, u64::MAX], &[i64::MIN, i64::MAX]);
         assert_eq!(interp.forward(0), Ok(i64::MIN));
         assert_eq!(interp.forward(u64::MAX), Ok(i64::MAX));
         assert_eq!(interp.forward(u64::MAX / 2 + 1), Ok(0));
@@ -449,7 +889,7 @@ mod tests {
 
     #[test]
     fn test_inverse_exact_big_numbers() {
-        let interp = Interp::new(vec![0, u64::MAX], vec![i64::MIN, i64::MAX]);
+        let interp = Interp::new(&[0, u64::MAX], &[i64::MIN, i64::MAX]);
         assert_eq!(interp.inverse(i64::MIN, Method::None), Ok(0));
         assert_eq!(interp.inverse(i64::MAX, Method::None), Ok(u64::MAX));
         assert_eq!(interp.inverse(0, Method::None), Ok(u64::MAX / 2 + 1));
@@ -457,7 +897,7 @@ mod tests {
 
     #[test]
     fn test_inverse_round_big_numbers() {
-        let interp = Interp::new(vec![0, u64::MAX], vec![i64::MIN, i64::MAX]);
+        let interp = Interp::new(&[0, u64::MAX], &[i64::MIN, i64::MAX]);
         assert_eq!(interp.inverse(i64::MIN, Method::Nearest), Ok(0));
         assert_eq!(interp.inverse(i64::MAX, Method::Nearest), Ok(u64::MAX));
         assert_eq!(interp.inverse(0, Method::Nearest), Ok(u64::MAX / 2 + 1));
@@ -465,7 +905,7 @@ mod tests {
 
     #[test]
     fn test_inverse_ffill_big_numbers() {
-        let interp = Interp::new(vec![0, u64::MAX], vec![i64::MIN, i64::MAX]);
+        let interp = Interp::new(&[0, u64::MAX], &[i64::MIN, i64::MAX]);
         assert_eq!(interp.inverse(i64::MIN, Method::ForwardFill), Ok(0));
         assert_eq!(interp.inverse(i64::MAX, Method::ForwardFill), Ok(u64::MAX));
         assert_eq!(interp.inverse(0, Method::ForwardFill), Ok(u64::MAX / 2 + 1));
@@ -473,7 +913,7 @@ mod tests {
 
     #[test]
     fn test_inverse_bfill_big_numbers() {
-        let interp = Interp::new(vec![0, u64::MAX], vec![i64::MIN, i64::MAX]);
+        let interp = Interp::new(&[0, u64::MAX], &[i64::MIN, i64::MAX]);
         assert_eq!(interp.inverse(i64::MIN, Method::BackwardFill), Ok(0));
         assert_eq!(interp.inverse(i64::MAX, Method::BackwardFill), Ok(u64::MAX));
         assert_eq!(
@@ -486,7 +926,7 @@ mod tests {
     fn test_use_case() {
         let xp: Vec<u64> = vec![0, 8];
         let fp: Vec<f64> = vec![100.0, 900.0];
-        let interp = Interp::new(xp, fp);
+        let interp = Interp::new(&xp, &fp);
         assert_eq!(interp.inverse(175.0, Method::Nearest), Ok(1))
     }
 }
@@ -1,5 +1,5 @@
 //! Forward and backward linear interpolation schemes between two points (x0, f0) and (x1, f1) for
-//! different data types (x is u64, f is either i64 or f64).
+//! different data types (x is u64, f is either i64, f32 or f64).
 //!
 //! When the values are integers, operations are performed with u128 integers to avoid overflow.
 //! Signed integers are mapped on positive values to avoid potential subtraction overflows
@@ -32,15 +32,24 @@ impl Forward<i64> for u64 {
 }
 impl Forward<f64> for u64 {
     fn forward(self, x0: u64, x1: u64, f0: f64, f1: f64) -> f64 {
-        let x = F80::from(self);
-        let x0 = F80::from(x0);
-        let x1 = F80::from(x1);
+        // index differences are exact in u64, sparing three extended-precision subtractions
+        let w0 = F80::from(x1 - self);
+        let w1 = F80::from(self - x0);
+        let dx = F80::from(x1 - x0);
         let f0 = F80::from(f0);
         let f1 = F80::from(f1);
-        f0.mul(&x1.sub(&x))
-            .add(&f1.mul(&x.sub(&x0)))
-            .div(&x1.sub(&x0))
-            .into()
+        f0.mul(&w0).add(&f1.mul(&w1)).div(&dx).into()
+    }
+}
+impl Forward<f32> for u64 {
+    fn forward(self, x0: u64, x1: u64, f0: f32, f1: f32) -> f32 {
+        // rounded once from extended precision, not through f64
+        let w0 = F80::from(x1 - self);
+        let w1 = F80::from(self - x0);
+        let dx = F80::from(x1 - x0);
+        let f0 = F80::from(f64::from(f0));
+        let f1 = F80::from(f64::from(f1));
+        f0.mul(&w0).add(&f1.mul(&w1)).div(&dx).into()
     }
 }
 
@@ -48,6 +57,10 @@ impl Forward<f64> for u64 {
 pub trait Inverse<X>: Copy + PartialOrd {
     /// Estimate x at values f between two points (x0, f0) and (x1, f1)
     fn inverse(self, x0: X, x1: X, f0: Self, f1: Self, method: Method) -> Option<X>;
+    /// Tells if the value is finite, integers always are.
+    fn is_finite(self) -> bool {
+        true
+    }
 }
 impl Inverse<u64> for u64 {
     fn inverse(self, x0: u64, x1: u64, f0: u64, f1: u64, method: Method) -> Option<u64> {
@@ -87,6 +100,18 @@ impl Inverse<u64> for f64 {
             Method::BackwardFill => Some(x.ceil().into()),
         }
     }
+    fn is_finite(self) -> bool {
+        f64::is_finite(self)
+    }
+}
+impl Inverse<u64> for f32 {
+    fn inverse(self, x0: u64, x1: u64, f0: f32, f1: f32, method: Method) -> Option<u64> {
+        // the widening to f64 is exact and the result is an index
+        f64::from(self).inverse(x0, x1, f64::from(f0), f64::from(f1), method)
+    }
+    fn is_finite(self) -> bool {
+        f32::is_finite(self)
+    }
 }
 
 /// Implements signed to unsinged translation. Used to apply schemes on unsigned integers where
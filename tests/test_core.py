@@ -1,7 +1,15 @@
 import numpy as np
 import pytest
 
-from xinterp import forward, inverse
+from xinterp import (
+    Interpolator,
+    forward,
+    forward_into,
+    forward_many,
+    inverse,
+    inverse_into,
+    inverse_many,
+)
 
 
 class TestForward:
@@ -27,17 +35,29 @@ class TestForward:
         with pytest.raises(ValueError, match="xp must have integer dtype"):
             forward([1], [0.0, 2.0], [3, 5])
 
+    def test_timedelta_xp(self):
+        xp = np.array([0, 10], "m8[s]")
+        assert np.array_equal(forward([5], xp, [0.0, 1.0]), [0.5])
+
     def test_raises_not_positive(self):
         with pytest.raises(ValueError, match="xp values must be positive"):
             forward([1], [-1, 2], [3, 5])
         with pytest.raises(ValueError, match="x values must be positive"):
             forward([-1], [1, 2], [3, 5])
+        with pytest.raises(ValueError, match="xp values must be positive"):
+            forward([1], np.array([-1, 2], "m8[s]"), [3, 5])
+        with pytest.raises(ValueError, match="x values must be positive"):
+            forward([-1], np.array([1, 2], "m8[s]"), [3, 5])
 
     def test_raises_not_finite(self):
         with pytest.raises(ValueError, match="fp values must be finite"):
             forward([1], [0, 2], [np.nan, np.nan])
         with pytest.raises(ValueError, match="fp values must be finite"):
             forward([1], [0, 2], [np.inf, np.inf])
+        with pytest.raises(ValueError, match="fp values must be finite"):
+            forward([1], [0, 2], np.array(["NaT", "NaT"], "M8[s]"))
+        with pytest.raises(ValueError, match="fp values must be finite"):
+            forward([1], [0, 2], np.array(["NaT", "2020-01-01"], ">M8[s]"))
 
     def test_dtype_matching(self):
         forward([1.0], [0, 2], [3, 5]) == 4
@@ -70,6 +90,22 @@ class TestForward:
         assert forward([1], [0, 2], np.array([3, 5], "f4")).dtype == "f4"
         assert forward(np.array([1], "u2"), np.array([0, 2], "u2"), [3, 5])[0] == 4
 
+    def test_dtype_dispatch(self):
+        assert forward([1], [0, 2], np.array([3, 5], "m8[s]")) == np.timedelta64(4, "s")
+        assert forward([1], [0, 2], np.array([3, 5], "m8[s]")).dtype == "m8[s]"
+        assert forward([1], [0, 3], np.array([0, 1], ">f4")) == np.float32(1 / 3)
+        fp = np.array([0, 1000, 2000], ">i8")
+        assert np.array_equal(forward([5, 15], [0, 10, 20], fp), [500, 1500])
+        xp = np.array([0, 255, 256], ">i8")
+        assert np.array_equal(forward([100, 200], xp, [0.0, 255.0, 256.0]), [100, 200])
+        assert inverse([500], [0, 10, 20], fp) == 5
+        fp = np.array([0, 1000, 2000], ">M8[s]")
+        assert forward([5], [0, 10, 20], fp) == np.datetime64(500, "s")
+        assert inverse(np.array([500], "M8[s]"), [0, 10, 20], fp) == 5
+        assert inverse(np.array([4], "f4"), [0, 2], np.array([3, 5], "f4")) == 1
+        with pytest.raises(ValueError, match="fp dtype must be either"):
+            forward([1], [0, 2], [True, False])
+
     def test_scalar_handling(self):
         assert forward([1], [0, 2], [3, 5]).ndim == 1
         assert forward(1, [0, 2], [3, 5]).ndim == 0
@@ -92,6 +128,27 @@ class TestForward:
         assert np.array_equal(result, expected)
         assert result.dtype == expected.dtype
 
+    def test_interpolation_exactness_big_int(self):
+        rng = np.random.default_rng(42)
+        n = 100
+        m = 1_000
+        integers = np.arange(0, 65_535)
+        xp = np.sort(rng.choice(integers, n, replace=False))
+        fp = 1_700_000_000_000_000_000 + np.cumsum(rng.integers(1, 1_000_000_007, n))
+        selected = np.arange(np.min(xp), np.max(xp) + 1)
+        x = np.sort(rng.choice(selected, m, replace=False))
+        result = forward(x, xp, fp)
+        expected = []
+        for value in x.tolist():
+            index = min(np.searchsorted(xp, value, side="right"), n - 1)
+            x0, x1 = xp[index - 1].item(), xp[index].item()
+            f0, f1 = fp[index - 1].item(), fp[index].item()
+            div, rem = divmod(f0 * (x1 - value) + f1 * (value - x0), x1 - x0)
+            if 2 * rem > x1 - x0 or (2 * rem == x1 - x0 and div % 2 == 1):
+                div += 1
+            expected.append(div)
+        assert np.array_equal(result, np.array(expected, dtype="i8"))
+
     def test_interpolation_accuracy_float(self):
         rng = np.random.default_rng(42)
         n = 1_000
@@ -130,9 +187,17 @@ class TestInverse:
         with pytest.raises(ValueError, match="xp must have integer dtype"):
             inverse([4], [0.0, 2.0], [3, 5])
 
+    def test_timedelta_xp(self):
+        xp = np.array([0, 10], "m8[s]")
+        result = inverse([0.5], xp, [0.0, 1.0])
+        assert np.array_equal(result, np.array([5], "m8[s]"))
+        assert result.dtype == "m8[s]"
+
     def test_raises_not_positive(self):
         with pytest.raises(ValueError, match="xp values must be positive"):
             inverse([4], [-1, 2], [3, 5])
+        with pytest.raises(ValueError, match="xp values must be positive"):
+            inverse([4], np.array([-1, 2], "m8[s]"), [3, 5])
 
     def test_raises_not_finite(self):
         with pytest.raises(ValueError, match="fp values must be finite"):
@@ -143,6 +208,10 @@ class TestInverse:
             inverse([np.nan], [0, 2], [3.0, 5.0])
         with pytest.raises(ValueError, match="f values must be finite"):
             inverse([np.inf], [0, 2], [3.0, 5.0])
+        with pytest.raises(ValueError, match="f values must be finite"):
+            inverse(np.array(["NaT"], "M8[s]"), [0, 2], np.array([3, 5], "M8[s]"))
+        with pytest.raises(ValueError, match="f values must be finite"):
+            inverse(np.array(["NaT"], ">M8[s]"), [0, 2], np.array([3, 5], ">M8[s]"))
 
     def test_dtype_matching(self):
         inverse([4.0], [0, 2], [3, 5]) == 1
@@ -189,6 +258,14 @@ class TestInverse:
         ):
             inverse([4], [0, 2], [3, 5], method="non_existing_method")
 
+    def test_method_built_at_runtime(self):
+        for method in ["nearest", "ffill", "bfill"]:
+            built = "".join(list(method))
+            assert built is not method
+            assert inverse([4], [0, 2], [3, 5], method=built) == inverse(
+                [4], [0, 2], [3, 5], method=method
+            )
+
     def test_type_handling(self):
         assert inverse([4], [0, 2], [3, 5]) == 1
         assert inverse([4.0], [0, 2], [3.0, 5.0]) == 1
@@ -288,3 +365,118 @@ class TestInverse:
         cases = [(1, 21), (2, 23), (3, 25), (4, 27), (5, 29), (6, 31), (7, 33), (8, 35)]
         for x, f in cases:
             assert inverse([float(f)], xp, fp, method="bfill")[0] == x
+
+
+class TestInterpolator:
+    def test_raises_on_construction(self):
+        with pytest.raises(ValueError, match="xp and fp must have the same length"):
+            Interpolator([0, 2, 5], [3, 5])
+        with pytest.raises(ValueError, match="fp values must be finite"):
+            Interpolator([0, 2], [np.nan, np.nan])
+        with pytest.raises(ValueError, match="fp dtype must be"):
+            Interpolator([0, 2], [True, False])
+
+    def test_matches_functions(self):
+        xp = np.array([0, 10, 20])
+        fp = np.array([0, 1000, 2000], dtype="datetime64[s]")
+        interp = Interpolator(xp, fp)
+        x = np.arange(21)
+        assert np.array_equal(interp.forward(x), forward(x, xp, fp))
+        assert interp.forward(5) == forward(5, xp, fp)
+        f = np.array([1, 499, 1001, 1503, 1997], dtype="datetime64[s]")
+        for method in ["nearest", "ffill", "bfill"]:
+            assert np.array_equal(
+                interp.inverse(f, method=method), inverse(f, xp, fp, method=method)
+            )
+        with pytest.raises(KeyError, match="f not found"):
+            interp.inverse(f)
+        with pytest.raises(ValueError, match="method must be either"):
+            interp.inverse(f, method="linear")
+
+    def test_data_points_are_copied(self):
+        xp = np.array([0, 10])
+        fp = np.array([0.0, 10.0])
+        interp = Interpolator(xp, fp)
+        fp[1] = 20.0
+        assert interp.forward(5) == 5.0
+        with pytest.raises(ValueError):
+            interp.fp[1] = 20.0
+
+
+class TestMany:
+    def test_forward_many(self):
+        xp = np.array([0, 10, 20])
+        fp = np.array([0, 1000, 2000], dtype="datetime64[s]")
+        xs = [[0, 5], 15, np.arange(21), []]
+        result = forward_many(xs, xp, fp)
+        assert len(result) == len(xs)
+        for x, values in zip(xs, result):
+            assert np.array_equal(values, forward(x, xp, fp))
+        with pytest.raises(IndexError, match="x out of bounds"):
+            forward_many([[0], [21]], xp, fp)
+        assert forward_many([], xp, fp) == []
+
+    def test_inverse_many(self):
+        xp = np.array([0, 10, 20])
+        fp = np.array([0.0, 1000.0, 2000.0])
+        fs = [[1.0, 499.0], 1503.0, np.linspace(0.0, 2000.0, 51)]
+        for method in ["nearest", "ffill", "bfill"]:
+            result = inverse_many(fs, xp, fp, method=method)
+            assert len(result) == len(fs)
+            for f, indices in zip(fs, result):
+                assert np.array_equal(indices, inverse(f, xp, fp, method=method))
+        with pytest.raises(KeyError, match="f not found"):
+            inverse_many([[0.0], [499.0]], xp, fp)
+        with pytest.raises(ValueError, match="method must be either"):
+            inverse_many(fs, xp, fp, method="linear")
+
+
+class TestInto:
+    def test_forward_into(self):
+        for fp in [
+            np.array([0.0, 1000.0, 2000.0]),
+            np.array([0.0, 1000.0, 2000.0], dtype="float32"),
+            np.array([0, 1000, 2000], dtype="int32"),
+            np.array([0, 1000, 2000], dtype=">i8"),
+            np.array([0, 1000, 2000], dtype="datetime64[s]"),
+        ]:
+            xp = np.array([0, 10, 20])
+            x = np.arange(21)
+            out = np.empty(x.shape, fp.dtype)
+            assert forward_into(x, xp, fp, out) is out
+            assert np.array_equal(out, forward(x, xp, fp))
+            out = np.empty((), fp.dtype)
+            assert forward_into(15, xp, fp, out) is out
+            assert out == forward(15, xp, fp)
+
+    def test_inverse_into(self):
+        xp = np.array([0, 10, 20], dtype="uint32")
+        fp = np.array([0.0, 1000.0, 2000.0])
+        f = np.linspace(0.0, 2000.0, 51)
+        out = np.empty(f.shape, xp.dtype)
+        assert inverse_into(f, xp, fp, out, method="nearest") is out
+        assert np.array_equal(out, inverse(f, xp, fp, method="nearest"))
+        out = np.zeros(2 * f.size, "uint64")[::2]
+        inverse_into(f, xp.astype("uint64"), fp, out, method="ffill")
+        assert np.array_equal(out, inverse(f, xp, fp, method="ffill"))
+
+    def test_raises_on_out(self):
+        xp = np.array([0, 10, 20])
+        fp = np.array([0.0, 1000.0, 2000.0])
+        with pytest.raises(ValueError, match="out must be an array"):
+            forward_into([5], xp, fp, [0.0])
+        with pytest.raises(ValueError, match="out must have the same shape"):
+            forward_into([5], xp, fp, np.empty(2))
+        with pytest.raises(ValueError, match="out must have dtype"):
+            forward_into([5], xp, fp, np.empty(1, "float32"))
+        out = np.empty(1)
+        out.setflags(write=False)
+        with pytest.raises(ValueError, match="out must be writeable"):
+            forward_into([5], xp, fp, out)
+        x = np.array([5, 15])
+        with pytest.raises(ValueError, match="out must not overlap the inputs"):
+            forward_into(x, xp, np.array([0, 1000, 2000]), x)
+        with pytest.raises(ValueError, match="out must not overlap the inputs"):
+            inverse_into([500.0, 1500.0], xp, fp, xp[1:])
+        with pytest.raises(KeyError, match="f out of bounds"):
+            inverse_into([3000.0], xp, fp, np.empty(1, xp.dtype))
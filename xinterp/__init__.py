@@ -1 +1,9 @@
-from .core import forward, inverse
+from .core import (
+    Interpolator,
+    forward,
+    forward_into,
+    forward_many,
+    inverse,
+    inverse_into,
+    inverse_many,
+)
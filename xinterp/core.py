@@ -25,6 +25,11 @@ def forward(x, xp, fp):
     ------
     IndexError
         If any value of `x` is outside the `xp` range.
+
+    Notes
+    -----
+    The GIL is released while interpolating, so that interpolations can run
+    concurrently from several threads.
     """
     return _forward(xp, fp, x=x)
 
@@ -57,44 +62,329 @@ def inverse(f, xp, fp, method=None):
     ------
     KeyError
         If any value of `f` is outside the `fp` range.
+
+    Notes
+    -----
+    The GIL is released while interpolating, so that interpolations can run
+    concurrently from several threads.
     """
+    check_method(method)
     return _inverse(xp, fp, f=f, method=method)
 
 
-def wraps(func_int, func_float):
-    def func(xp, fp, *, x=None, f=None, **kwargs):
-        xp, fp, x, f, isscalar = check(xp, fp, x, f)
-        if np.issubdtype(fp.dtype, np.integer) or np.issubdtype(
-            fp.dtype, np.datetime64
-        ):
-            if x is not None:
-                out = func_int(
-                    x.astype("u8"), xp.astype("u8"), fp.astype("i8"), **kwargs
-                ).astype(fp.dtype)
-            if f is not None:
-                out = func_int(
-                    f.astype("i8"), xp.astype("u8"), fp.astype("i8"), **kwargs
-                ).astype(xp.dtype)
-        elif np.issubdtype(fp.dtype, np.floating):
-            if x is not None:
-                out = func_float(
-                    x.astype("u8"), xp.astype("u8"), fp.astype("f8"), **kwargs
-                ).astype(fp.dtype)
-            if f is not None:
-                out = func_float(
-                    f.astype("f8"), xp.astype("u8"), fp.astype("f8"), **kwargs
-                ).astype(xp.dtype)
+def forward_into(x, xp, fp, out):
+    """
+    One-dimensional linear interpolation from indices to values, written into an
+    existing array.
+
+    Parameters
+    ----------
+    x : 1-D sequence or scalar of positive integers
+        The indices at which to evaluate the interpolated values.
+    xp : 1-D sequence of positive integers
+        The indices of the data points, must be strictly increasing.
+    fp : 1-D sequence of floats, integers or datetime64s
+        The values of the data points, same length as `xp`.
+    out : ndarray
+        The writeable array in which to store the interpolated values, same shape as
+        `x` (0-D if `x` is a scalar) and same dtype as `fp`. It must not overlap the
+        other inputs.
+
+    Returns
+    -------
+    ndarray
+        The `out` array.
+
+    Raises
+    ------
+    IndexError
+        If any value of `x` is outside the `xp` range.
+    ValueError
+        If `out` has the wrong shape or dtype, is not writeable or overlaps the
+        inputs.
+
+    Notes
+    -----
+    When `out` is contiguous and its dtype matches the one of the kernel, the values
+    are written in place and no output array is allocated. `out` may be partially
+    written if an error is raised.
+    """
+    return _forward(xp, fp, x=x, out=out)
+
+
+def inverse_into(f, xp, fp, out, method=None):
+    """
+    One-dimensional linear interpolation from values to indices, written into an
+    existing array.
+
+    Parameters
+    ----------
+    f : 1-D sequence or scalar of floats, integers or datetime64s
+        The values at which to evaluate the interpolated indices.
+    xp : 1-D sequence of positive integers
+        The indices of the data points, same length as `fp`.
+    fp : 1-D sequence of floats, integers or datetime64s
+        The values of the data points, must be strictly increasing.
+    out : ndarray
+        The writeable array in which to store the interpolated indices, same shape as
+        `f` (0-D if `f` is a scalar) and same dtype as `xp`. It must not overlap the
+        other inputs.
+    method : str or None, optional
+        The method to use for inexact matches, see `inverse`.
+
+    Returns
+    -------
+    ndarray
+        The `out` array.
+
+    Raises
+    ------
+    KeyError
+        If any value of `f` is outside the `fp` range.
+    ValueError
+        If `out` has the wrong shape or dtype, is not writeable or overlaps the
+        inputs.
+
+    Notes
+    -----
+    When `out` is contiguous and its dtype matches the one of the kernel, the indices
+    are written in place and no output array is allocated. `out` may be partially
+    written if an error is raised.
+    """
+    check_method(method)
+    return _inverse(xp, fp, f=f, method=method, out=out)
+
+
+def forward_many(xs, xp, fp):
+    """
+    One-dimensional linear interpolation from indices to values, for several sets of
+    indices over the same data points.
+
+    Parameters
+    ----------
+    xs : sequence of 1-D sequences or scalars of positive integers
+        The sets of indices at which to evaluate the interpolated values.
+    xp : 1-D sequence of positive integers
+        The indices of the data points, must be strictly increasing.
+    fp : 1-D sequence of floats, integers or datetime64s
+        The values of the data points, same length as `xp`.
+
+    Returns
+    -------
+    list of 1-D arrays or scalars of floats, integers or datetime64s.
+        The interpolated values, one per set of indices, same shapes as in `xs`.
+
+    Raises
+    ------
+    IndexError
+        If any value of `xs` is outside the `xp` range.
+    """
+    xp, fp = check_points(xp, fp)
+    kernel, dtype = lookup(FORWARD, fp)
+    xs = [check_x(x, xp) for x in xs]
+    if not xs:
+        return []
+    x = np.concatenate([x for x, _ in xs])
+    out = kernel(cast(x, "u8"), cast(xp, "u8"), cast(fp, dtype))
+    return split(cast(out, fp.dtype), xs)
+
+
+def inverse_many(fs, xp, fp, method=None):
+    """
+    One-dimensional linear interpolation from values to indices, for several sets of
+    values over the same data points.
+
+    Parameters
+    ----------
+    fs : sequence of 1-D sequences or scalars of floats, integers or datetime64s
+        The sets of values at which to evaluate the interpolated indices.
+    xp : 1-D sequence of positive integers
+        The indices of the data points, same length as `fp`.
+    fp : 1-D sequence of floats, integers or datetime64s
+        The values of the data points, must be strictly increasing.
+    method : str or None, optional
+        The method to use for inexact matches, see `inverse`.
+
+    Returns
+    -------
+    list of 1-D arrays or scalars of positive integers.
+        The interpolated indices, one per set of values, same shapes as in `fs`.
+
+    Raises
+    ------
+    KeyError
+        If any value of `fs` is outside the `fp` range.
+    """
+    check_method(method)
+    xp, fp = check_points(xp, fp)
+    kernel, dtype = lookup(INVERSE, fp)
+    fs = [check_f(f, fp) for f in fs]
+    if not fs:
+        return []
+    f = np.concatenate([f for f, _ in fs])
+    out = kernel(cast(f, dtype), cast(xp, "u8"), cast(fp, dtype), method)
+    return split(cast(out, xp.dtype), fs)
+
+
+class Interpolator:
+    """
+    Piecewise linear mapping between indices and values.
+
+    The data points are converted once at construction, and their shapes, dtypes and
+    finiteness validated, so that successive interpolations over the same data points
+    mostly process their queries. Their monotonicity is still checked by the kernels on
+    every call, as only `forward` needs increasing `xp` and only `inverse` increasing
+    `fp`.
+    The data points are copied and exposed as read-only `xp` and `fp` attributes.
+
+    Parameters
+    ----------
+    xp : 1-D sequence of positive integers
+        The indices of the data points.
+    fp : 1-D sequence of floats, integers or datetime64s
+        The values of the data points, same length as `xp`.
+    """
+
+    def __init__(self, xp, fp):
+        xp, fp = check_points(np.array(xp), np.array(fp))
+        self._forward_kernel, self._dtype = lookup(FORWARD, fp)
+        self._inverse_kernel, dtype = lookup(INVERSE, fp)
+        assert dtype == self._dtype
+        # The kernels also reject non-finite fp, but only when called: checking here
+        # reports non-finite data points at construction.
+        if fp.dtype.kind == "f" and not np.isfinite([fp.min(), fp.max()]).all():
+            raise ValueError("fp values must be finite")
+        xp.setflags(write=False)
+        fp.setflags(write=False)
+        self.xp = xp
+        self.fp = fp
+        self._xp = cast(xp, "u8")
+        self._fp = cast(fp, self._dtype)
+
+    def forward(self, x):
+        """
+        Interpolate values at the given indices, see `forward`.
+        """
+        x, isscalar = check_x(x, self.xp)
+        out = self._forward_checked(x)
+        if isscalar:
+            return out[0]
         else:
-            raise ValueError("fp dtype must be either integer, floating or datetime")
+            return out
+
+    def inverse(self, f, method=None):
+        """
+        Interpolate indices at the given values, see `inverse`.
+        """
+        check_method(method)
+        f, isscalar = check_f(f, self.fp)
+        out = self._inverse_checked(f, method)
         if isscalar:
             return out[0]
         else:
             return out
 
+    def _forward_checked(self, x):
+        out = self._forward_kernel(cast(x, "u8"), self._xp, self._fp)
+        return cast(out, self.fp.dtype)
+
+    def _inverse_checked(self, f, method):
+        out = self._inverse_kernel(cast(f, self._dtype), self._xp, self._fp, method)
+        return cast(out, self.xp.dtype)
+
+
+def split(out, queries):
+    """
+    Split results computed on concatenated queries back into one result per query.
+    """
+    sections = np.cumsum([len(query) for query, _ in queries[:-1]])
+    return [
+        values[0] if isscalar else values
+        for values, (_, isscalar) in zip(np.split(out, sections), queries)
+    ]
+
+
+def wraps(kernels):
+    def func(xp, fp, *, x=None, f=None, method=None, out=None):
+        xp, fp, x, f, isscalar = check(xp, fp, x, f)
+        kernel, dtype = lookup(kernels, fp)
+        if x is not None:
+            buffer = check_out(out, x, xp, fp, isscalar, fp.dtype, dtype)
+            result = kernel(cast(x, "u8"), cast(xp, "u8"), cast(fp, dtype), buffer)
+            result = cast(result, fp.dtype)
+        if f is not None:
+            buffer = check_out(out, f, xp, fp, isscalar, xp.dtype, "u8")
+            result = kernel(
+                cast(f, dtype), cast(xp, "u8"), cast(fp, dtype), method, buffer
+            )
+            result = cast(result, xp.dtype)
+        if out is not None:
+            if buffer is None:
+                out[...] = result.reshape(out.shape)
+            return out
+        if isscalar:
+            return result[0]
+        else:
+            return result
+
     return func
 
 
+def lookup(kernels, fp):
+    for key in (fp.dtype.str[1:], fp.dtype.kind):
+        if key in kernels:
+            return kernels[key]
+    raise ValueError("fp dtype must be either integer, floating or datetime")
+
+
+def cast(a, dtype):
+    """
+    Cast an array to a contiguous array of the given dtype.
+
+    Arrays that are already contiguous with the right dtype are returned as is. Signed
+    and unsigned 64-bit integers, datetimes and timedeltas share the same memory layout:
+    casts between them are zero-copy views instead of conversions.
+    """
+    dtype = np.dtype(dtype)
+    if a.dtype != dtype and viewable(a.dtype, dtype):
+        return np.ascontiguousarray(a).view(dtype)
+    return np.ascontiguousarray(a, dtype=dtype)
+
+
+def viewable(src, dst):
+    """
+    Tell if `cast` turns contiguous arrays of dtype `src` into views of dtype `dst`.
+
+    Only native byte orders share the memory layout of the kernels: other arrays must
+    be converted.
+    """
+    kinds = {src.kind, dst.kind}
+    return (
+        src.isnative
+        and dst.isnative
+        and (
+            src == dst
+            or (
+                src.itemsize == dst.itemsize == 8
+                and kinds <= set("iumM")
+                and not kinds <= set("mM")
+            )
+        )
+    )
+
+
 def check(xp, fp, x=None, f=None):
+    xp, fp = check_points(xp, fp)
+    if (x is None) == (f is None):
+        raise ValueError("either x or f must be provided")
+    if x is not None:
+        x, isscalar = check_x(x, xp)
+    if f is not None:
+        f, isscalar = check_f(f, fp)
+    return xp, fp, x, f, isscalar
+
+
+def check_points(xp, fp):
     xp = np.asarray(xp)
     fp = np.asarray(fp)
     if not (xp.ndim == 1 and fp.ndim == 1):
@@ -103,46 +393,102 @@ def check(xp, fp, x=None, f=None):
         raise ValueError("xp and fp must have the same length")
     if not (len(xp) > 1 and len(fp) > 1):
         raise ValueError("xp and fp must have at least two elements")
-    if not np.issubdtype(xp.dtype, np.integer):
+    if xp.dtype.kind not in "ium":
         raise ValueError("xp must have integer dtype")
-    if not np.all(xp >= 0):
+    if xp.dtype.kind in "im" and xp.min() < 0:
         raise ValueError("xp values must be positive")
-    if not np.all(np.isfinite(fp)):
+    if fp.dtype.kind in "mM" and hasnat(fp):
         raise ValueError("fp values must be finite")
-    if (x is None) == (f is None):
-        raise ValueError("either x or f must be provided")
-    if x is not None:
-        x = np.asarray(x).astype(xp.dtype)
-        if x.ndim == 0:
-            x = x.reshape(1)
-            isscalar = True
-        elif x.ndim == 1:
-            isscalar = False
-        else:
-            raise ValueError("x must be 1D or scalar")
-        if not x.dtype == xp.dtype:
-            raise ValueError("x and xp must have the same dtype")
-        if not np.all(x >= 0):
-            raise ValueError("x values must be positive")
-        if not np.all(xp[1:] > xp[:-1]):
-            raise ValueError("xp must be strictly increasing")
-    if f is not None:
-        f = np.asarray(f).astype(fp.dtype)
-        if f.ndim == 0:
-            f = f.reshape(1)
-            isscalar = True
-        elif f.ndim == 1:
-            isscalar = False
-        else:
-            raise ValueError("f must be 1D or scalar")
-        if not f.dtype == fp.dtype:
-            raise ValueError("f and fp must have the same dtype")
-        if not np.all(np.isfinite(f)):
-            raise ValueError("f values must be finite")
-        if not np.all(fp[1:] > fp[:-1]):
-            raise ValueError("fp must be strictly increasing")
-    return xp, fp, x, f, isscalar
+    return xp, fp
+
+
+def check_x(x, xp):
+    x = np.asarray(x).astype(xp.dtype, copy=False)
+    if x.ndim == 0:
+        x = x.reshape(1)
+        isscalar = True
+    elif x.ndim == 1:
+        isscalar = False
+    else:
+        raise ValueError("x must be 1D or scalar")
+    if x.dtype.kind in "im" and x.size and x.min() < 0:
+        raise ValueError("x values must be positive")
+    return x, isscalar
+
+
+def check_f(f, fp):
+    f = np.asarray(f).astype(fp.dtype, copy=False)
+    if f.ndim == 0:
+        f = f.reshape(1)
+        isscalar = True
+    elif f.ndim == 1:
+        isscalar = False
+    else:
+        raise ValueError("f must be 1D or scalar")
+    if f.dtype.kind in "mM" and hasnat(f):
+        raise ValueError("f values must be finite")
+    return f, isscalar
+
+
+def check_out(out, query, xp, fp, isscalar, dtype, kernel_dtype):
+    """
+    Validate an output array and return it as a buffer the kernel can write into.
+
+    The buffer is a contiguous view of `out` with the kernel dtype, or None when `out`
+    cannot be viewed so, in which case the kernel allocates and the result is copied.
+    Viewability is decided from metadata only, so that no array is built in vain.
+    """
+    if out is None:
+        return None
+    if not isinstance(out, np.ndarray):
+        raise ValueError("out must be an array")
+    if out.shape != (() if isscalar else query.shape):
+        raise ValueError("out must have the same shape as the query")
+    if out.dtype != dtype:
+        raise ValueError(f"out must have dtype {dtype}")
+    if not out.flags.writeable:
+        raise ValueError("out must be writeable")
+    if any(np.may_share_memory(out, a) for a in (query, xp, fp)):
+        raise ValueError("out must not overlap the inputs")
+    kernel_dtype = np.dtype(kernel_dtype)
+    if out.flags.c_contiguous and viewable(out.dtype, kernel_dtype):
+        return out.reshape(-1).view(kernel_dtype)
+    return None
+
+
+def hasnat(a):
+    """
+    Tell if a datetime or timedelta array holds NaT.
+
+    NaT is stored as the smallest int64, so a single min reduction on the int64 view
+    finds it, without building a boolean temporary. This only holds for native byte
+    orders: other arrays go through `np.isnat`.
+    """
+    if not a.dtype.isnative:
+        return bool(np.isnat(a).any())
+    return a.size > 0 and a.view("i8").min() == np.iinfo(np.int64).min
+
+
+def check_method(method):
+    if method not in (None, "nearest", "ffill", "bfill"):
+        raise ValueError("method must be either None, 'nearest', 'ffill' or 'bfill'")
 
 
-_forward = wraps(rust.forward_int, rust.forward_float)
-_inverse = wraps(rust.inverse_int, rust.inverse_float)
+FORWARD = {
+    "i": (rust.forward_int, "i8"),
+    "u": (rust.forward_int, "i8"),
+    "m": (rust.forward_int, "i8"),
+    "M": (rust.forward_int, "i8"),
+    "f": (rust.forward_float, "f8"),
+    "f4": (rust.forward_float32, "f4"),
+}
+INVERSE = {
+    "i": (rust.inverse_int, "i8"),
+    "u": (rust.inverse_int, "i8"),
+    "m": (rust.inverse_int, "i8"),
+    "M": (rust.inverse_int, "i8"),
+    "f": (rust.inverse_float, "f8"),
+    "f4": (rust.inverse_float32, "f4"),
+}
+_forward = wraps(FORWARD)
+_inverse = wraps(INVERSE)